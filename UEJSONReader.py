@@ -1,26 +1,54 @@
 import json
-import matplotlib.pyplot as plt
+import numpy as np
 from tkinter import Tk, Button, Label, OptionMenu, StringVar, Toplevel, Text, Scrollbar, END, Checkbutton, BooleanVar, Entry
 import os
-import glob
-from matplotlib.ticker import FuncFormatter
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import re
+from collections import namedtuple
 from pprint import pprint
 
-# We need to set the backend to 'TkAgg' for proper Tkinter integration
-# and interactive features like event handling.
+# orjson decodes JSON several times faster than the stdlib; fall back to the
+# stdlib parser when it is not installed. Both accept bytes input, so files
+# are always read in binary mode and the text-layer decode pass is skipped.
 try:
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    plt.switch_backend('TkAgg')
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    print("Warning: TkAgg backend not found. Matplotlib interactivity may be limited.")
+    _json_loads = json.loads
+
+# ijson lets us stream just the Damage rows out of a BalanceAttributes file
+# without materializing the whole table; optional, like orjson.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Cache of parsed JSON keyed by (path, mtime) so each file is only read and
+# parsed once per session. A changed file gets a new mtime and a fresh parse.
+_JSON_CACHE = {}
 
 def get_json_data(file_path):
-    """Safely loads and returns JSON data from a given file path."""
+    """Safely loads and returns JSON data from a given file path.
+
+    Results are cached per (path, mtime), so repeated calls for the same
+    unchanged file reuse the already-parsed data instead of re-reading it.
+    """
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        cache_key = (file_path, os.path.getmtime(file_path))
+    except OSError:
+        print(f"Error: The file {file_path} was not found.")
+        return None
+
+    if cache_key in _JSON_CACHE:
+        return _JSON_CACHE[cache_key]
+
+    try:
+        # Binary mode with a large buffer: one read, no text decoding.
+        with open(file_path, 'rb', buffering=65536) as f:
+            data = _json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: The file {file_path} was not found.")
         return None
@@ -28,6 +56,62 @@ def get_json_data(file_path):
         print(f"Error: Invalid JSON format in {file_path}.")
         return None
 
+    _JSON_CACHE[cache_key] = data
+    return data
+
+def _root(data):
+    """Returns the top-level object of a UE-exported JSON list wrapper."""
+    return data[0]
+
+# Structured form of an ATT_* curve file: `curves` is a list of
+# (time array, value array) pairs, one per life stage. Extracting the packed
+# arrays once means downstream code never re-walks the nested key dicts.
+CurveFile = namedtuple('CurveFile', 'curves y_label')
+
+def _extract_float_curves(data):
+    """Returns the raw FloatCurve list from parsed data, or None."""
+    content = _root(data)
+    if "FloatCurves" in content:
+        return content["FloatCurves"]
+    if "Properties" in content and "FloatCurve" in content["Properties"]:
+        return [content["Properties"]["FloatCurve"]]
+    return None
+
+def _curve_file_from_data(data):
+    """Builds a CurveFile from parsed JSON, or None if it holds no curves."""
+    if not data:
+        return None
+    try:
+        float_curves = _extract_float_curves(data)
+        if not float_curves or not float_curves[0]:
+            return None
+        curves = []
+        for curve in float_curves:
+            keys = curve["Keys"]
+            time_points = np.fromiter((key["Time"] for key in keys), dtype=np.float64, count=len(keys))
+            values = np.fromiter((key["Value"] for key in keys), dtype=np.float64, count=len(keys))
+            curves.append((time_points, values))
+    except (KeyError, IndexError, TypeError):
+        return None
+    return CurveFile(curves=curves, y_label="Value")
+
+_CURVE_CACHE = {}
+
+def get_curve_file(file_path):
+    """Loads an ATT_* file as a CurveFile; cached per (path, mtime) like get_json_data."""
+    try:
+        cache_key = (file_path, os.path.getmtime(file_path))
+    except OSError:
+        return None
+    if cache_key in _CURVE_CACHE:
+        return _CURVE_CACHE[cache_key]
+    curve_file = _curve_file_from_data(get_json_data(file_path))
+    _CURVE_CACHE[cache_key] = curve_file
+    return curve_file
+
+# Precompiled once; used to split CamelCase names into words for display.
+_CAMEL_RE = re.compile(r'([A-Z])')
+
 def format_file_name(file_name, dinosaur_name):
     """Cleans up and formats the file name for display in the UI."""
     name = os.path.basename(file_name)
@@ -36,13 +120,13 @@ def format_file_name(file_name, dinosaur_name):
         name = name.replace(f"ATT_{dinosaur_name}_", "")
     elif name.startswith("DT_"):
         name = name.replace(f"DT_{dinosaur_name}", "")
-    name = re.sub(r'([A-Z])', r' \1', name).strip()
+    name = _CAMEL_RE.sub(r' \1', name).strip()
     return name
 
 def format_virtual_name(name):
     """Cleans up and formats the virtual file name."""
     # Split words based on uppercase letters
-    name = re.sub(r'([A-Z])', r' \1', name).strip()
+    name = _CAMEL_RE.sub(r' \1', name).strip()
     return name
 
 def plot_data(time_points_list, values_list, file_name, y_label):
@@ -54,29 +138,98 @@ def plot_data(time_points_list, values_list, file_name, y_label):
         print("Error: No data to plot.")
         return
 
-    # Create the figure and axes
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Matplotlib's import chain adds a noticeable delay before the main
+    # window shows, so it is only imported here; the first plot pays the cost.
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.ticker import FuncFormatter
+
+    # Embed the figure in its own Toplevel instead of going through pyplot:
+    # no blocking show() call, no backend manager to reinitialize per plot,
+    # and several plot windows can stay open and responsive at once.
+    window = Toplevel()
+    window.title(f'Plot of {file_name}')
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot(111)
+    canvas = FigureCanvasTkAgg(fig, master=window)
+    # Keep the zoom/pan/save toolbar the pyplot window used to provide; the
+    # draw_event hook recaptures the blit background after pan/zoom.
+    NavigationToolbar2Tk(canvas, window)
+    canvas.get_tk_widget().pack(expand=True, fill='both')
+
+    # Convert each curve to a NumPy array once; the max and the plot calls
+    # then work on packed arrays instead of Python lists.
+    time_arrays = [np.asarray(t, dtype=float) for t in time_points_list]
+    value_arrays = [np.asarray(v, dtype=float) for v in values_list]
 
     all_lines = []
-    y_max = 0
+    y_max = max((v.max() for v in value_arrays if v.size), default=0)
 
     # Plot each curve
-    for i, (time_points, values) in enumerate(zip(time_points_list, values_list)):
+    for i, (time_points, values) in enumerate(zip(time_arrays, value_arrays)):
         if i == 0:
             label = "Senior"
         else:
             label = "Elder"
-        line, = ax.plot(time_points, values, marker='o', linestyle='-', label=label)
+        # Thin the markers on dense curves so no line draws more than ~50.
+        line, = ax.plot(time_points, values, marker='o', linestyle='-', label=label,
+                        markevery=max(1, values.size // 50))
         all_lines.append(line)
-        if values:
-            y_max = max(y_max, max(values))
 
     # Prepare the tooltip annotation
     annot = ax.annotate("", xy=(0,0), xytext=(20, 20), textcoords="offset points",
                         bbox=dict(boxstyle="round,pad=0.3", fc="yellow", alpha=0.5),
                         arrowprops=dict(arrowstyle="->"))
     annot.set_visible(False)
-    
+    # The tooltip is animated so normal draws skip it; hover events then only
+    # restore the cached background and re-draw the annotation itself instead
+    # of rasterizing the whole figure on every mouse move.
+    annot.set_animated(True)
+
+    background = None
+
+    # The curves are monotone in time, so the hovered keyframe can be found
+    # with a binary search on each line's x array — no per-point hit test
+    # needed. The snap threshold scales with the widest curve's time span.
+    xs_sorted = [np.asarray(line.get_xdata(), dtype=float) for line in all_lines]
+    x_threshold = 0.02 * max((xs[-1] - xs[0] for xs in xs_sorted if xs.size), default=1.0)
+    last_hover = None # (line index, point index) currently shown
+
+    def nearest_point(event):
+        """Returns the (line index, point index) nearest the cursor, or None."""
+        best = None
+        best_dy = float('inf')
+        for line_index, (xs, line) in enumerate(zip(xs_sorted, all_lines)):
+            if not xs.size:
+                continue
+            index = int(np.searchsorted(xs, event.xdata))
+            if index >= xs.size or (index > 0 and event.xdata - xs[index - 1] < xs[index] - event.xdata):
+                index -= 1
+            if abs(xs[index] - event.xdata) > x_threshold:
+                continue
+            # When several lines have a keyframe at this time, prefer the one
+            # closest to the cursor vertically.
+            dy = abs(line.get_ydata()[index] - event.ydata)
+            if dy < best_dy:
+                best_dy = dy
+                best = (line_index, index)
+        return best
+
+    def on_draw(event):
+        """Recaptures the clean background after any full redraw (e.g. resize)."""
+        nonlocal background
+        background = fig.canvas.copy_from_bbox(ax.bbox)
+
+    def blit_annot():
+        """Repaints just the tooltip over the cached background."""
+        if background is None:
+            fig.canvas.draw_idle()
+            return
+        fig.canvas.restore_region(background)
+        if annot.get_visible():
+            ax.draw_artist(annot)
+        fig.canvas.blit(ax.bbox)
+
     def update_annot(line_obj, index):
         """Updates the tooltip text and position, keeping it within bounds."""
         xdata, ydata = line_obj.get_data()
@@ -98,32 +251,34 @@ def plot_data(time_points_list, values_list, file_name, y_label):
         text = f"Time: {x:.2f}\n{y_label}: {y:.2f}"
         annot.set_text(text)
         annot.set_visible(True)
-        fig.canvas.draw_idle()
+        blit_annot()
 
     def on_hover(event):
         """Event handler for mouse movement."""
-        if event.inaxes != ax:
+        nonlocal last_hover
+        if event.inaxes != ax or event.xdata is None:
+            last_hover = None
             if annot.get_visible():
                 annot.set_visible(False)
-                fig.canvas.draw_idle()
+                blit_annot()
             return
-        
-        found_point = False
-        for line in all_lines:
-            contains, info = line.contains(event)
-            if contains:
-                index = info['ind'][0]
-                update_annot(line, index)
-                found_point = True
-                break
-        
-        if not found_point:
+
+        hit = nearest_point(event)
+        if hit == last_hover:
+            return # Still within the same keyframe's basin; nothing to redraw.
+        last_hover = hit
+
+        if hit is None:
             if annot.get_visible():
                 annot.set_visible(False)
-                fig.canvas.draw_idle()
+                blit_annot()
+        else:
+            line_index, point_index = hit
+            update_annot(all_lines[line_index], point_index)
 
-    # Connect the hover event
+    # Connect the hover and background-capture events
     fig.canvas.mpl_connect("motion_notify_event", on_hover)
+    fig.canvas.mpl_connect("draw_event", on_draw)
 
     # Add labels, title, and other plot customizations
     ax.set_xlabel('Time')
@@ -137,8 +292,8 @@ def plot_data(time_points_list, values_list, file_name, y_label):
     formatter = FuncFormatter(lambda x, pos: f'{int(x * 100)}%')
     ax.xaxis.set_major_formatter(formatter)
     
-    # Show the plot in a new window
-    plt.show(block=True)
+    # Render into the embedded canvas; the Tk mainloop keeps running.
+    canvas.draw()
     
 def show_balance_table(file_path):
     """Displays the data from a BalanceAttributes file in a new window."""
@@ -159,7 +314,7 @@ def show_balance_table(file_path):
     # Convert the JSON data to a formatted string
     table_string = ""
     try:
-        rows = data[0].get("Rows", {})
+        rows = _root(data).get("Rows", {})
         for key, value_dict in rows.items():
             value = value_dict.get("AttributePercentageValues")
             if value is not None:
@@ -170,52 +325,84 @@ def show_balance_table(file_path):
     text_widget.insert(END, table_string)
     text_widget.config(state='disabled') # Make it read-only
 
+# On-disk cache of per-file plottability results so repeat launches can skip
+# parsing attribute files that have not changed. Each entry maps an absolute
+# path to [mtime, size, plottable].
+_LINEARITY_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "isle_reader", "linearity.json")
+
+def _load_linearity_cache():
+    """Loads the persisted plottability cache, or an empty one if missing."""
+    try:
+        with open(_LINEARITY_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def _save_linearity_cache(cache):
+    """Writes the plottability cache back to disk; failure is harmless."""
+    try:
+        os.makedirs(os.path.dirname(_LINEARITY_CACHE_PATH), exist_ok=True)
+        with open(_LINEARITY_CACHE_PATH, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass # The cache is only an optimization.
+
 def is_linear_or_flat(file_path):
     """
     Checks if a JSON file represents a linear or flat curve based on its data points.
     A curve is considered linear or flat if it has two or fewer keyframes, or if
     the slope between all consecutive points is the same.
     """
-    data = get_json_data(file_path)
-    if not data:
-        return True
+    return _is_linear_or_flat_curve(get_curve_file(file_path))
 
-    try:
-        float_curves = data[0].get("FloatCurves") or [data[0].get("Properties", {}).get("FloatCurve")]
-        keys = float_curves[0]["Keys"]
-        
-        # If there are 2 or fewer points, the curve is always a straight line
-        if len(keys) <= 2:
-            return True
-        
-        time_points = [key["Time"] for key in keys]
-        values = [key["Value"] for key in keys]
+def _is_linear_or_flat_curve(curve_file):
+    """Linearity check on an already-extracted CurveFile, avoiding a re-read."""
+    if curve_file is None or not curve_file.curves:
+        return True # Assume it's unplottable or invalid
 
-        # Check for a flat curve (all values are the same)
-        first_value = values[0]
-        if all(v == first_value for v in values):
-            return True
+    time_points, values = curve_file.curves[0]
 
-        # Check for a linear curve (all slopes are the same)
-        # Avoid division by zero if time points are the same
-        first_slope = (values[1] - values[0]) / (time_points[1] - time_points[0]) if time_points[1] - time_points[0] != 0 else float('inf')
-        
-        for i in range(2, len(keys)):
-            # Avoid division by zero
-            time_diff = time_points[i] - time_points[i-1]
-            if time_diff == 0:
-                current_slope = float('inf')
-            else:
-                current_slope = (values[i] - values[i-1]) / time_diff
-            
-            # Compare with tolerance for floating point numbers
-            if abs(current_slope - first_slope) > 1e-9:
-                return False
+    # If there are 2 or fewer points, the curve is always a straight line
+    if time_points.size <= 2:
+        return True
+
+    # Check for a flat curve (all values are the same)
+    if np.all(values == values[0]):
+        return True
+
+    # Check for a linear curve (all slopes are the same). Comparing the
+    # cross-multiplied form dv[i]*dt[i-1] == dv[i-1]*dt[i] avoids
+    # dividing by zero when consecutive time points are identical.
+    dt = np.diff(time_points)
+    dv = np.diff(values)
+    return bool(np.allclose(dv[1:] * dt[:-1], dv[:-1] * dt[1:], atol=1e-9))
 
-        return True # It passed all the checks, so it's linear.
+def _get_damage_attributes(balance_file_path):
+    """Returns the non-zero Damage.* rows of a BalanceAttributes file.
 
+    With ijson installed the rows are streamed straight off the file, so the
+    rest of the balance table is never materialized; otherwise the cached
+    full parse from get_json_data is filtered. Returns None on failure.
+    """
+    if ijson is not None:
+        try:
+            with open(balance_file_path, 'rb') as f:
+                # ijson yields Decimal for floats, hence the float() calls.
+                return {k: float(v["AttributePercentageValues"])
+                        for k, v in ijson.kvitems(f, 'item.Rows')
+                        if k.startswith("Damage.") and v.get("AttributePercentageValues")}
+        except (OSError, KeyError, ijson.JSONError):
+            return None
+
+    balance_data = get_json_data(balance_file_path)
+    if not balance_data:
+        return None
+    try:
+        rows = _root(balance_data)["Rows"]
     except (KeyError, IndexError, TypeError):
-        return True # Assume it's unplottable or invalid if there's a parsing error
+        return None
+    return {k: v["AttributePercentageValues"] for k, v in rows.items()
+            if k.startswith("Damage.") and v["AttributePercentageValues"] != 0}
 
 class JSONPlotterUI:
     def __init__(self, master):
@@ -224,9 +411,29 @@ class JSONPlotterUI:
         
         self.root_dir = ""
         self.folders = []
+        # Display name -> (path, CurveFile or None). Validation already
+        # extracts the curves, so plotting never goes back to disk; entries
+        # whose curves were answered from the plottability index carry None
+        # and are extracted lazily on first plot.
         self.json_files_paths = {}
         self.virtual_files_data = {}
 
+        # Worker pool for parsing attribute files off the Tk thread; the
+        # token lets stale results be dropped if the user switches dinosaurs
+        # before a previous validation pass finishes.
+        self._validator_pool = ThreadPoolExecutor(max_workers=8)
+        self._update_token = 0
+
+        # Virtual attack curves per dinosaur, so reselecting a previously
+        # viewed dinosaur skips rebuilding them. Cleared when root_dir moves.
+        self._virtual_cache = {}
+
+        # Persistent plottability index, loaded from disk once per session
+        # and flushed back on exit if any verdicts changed.
+        self._plot_index = _load_linearity_cache()
+        self._plot_index_dirty = False
+        atexit.register(self._save_plot_index)
+
         self.folder_var = StringVar(master)
         self.json_file_var = StringVar(master)
         self.override_path_var = BooleanVar(master)
@@ -260,6 +467,12 @@ class JSONPlotterUI:
 
         self.auto_locate_jsons_folder()
 
+    def _save_plot_index(self):
+        """Flushes the plottability index to disk if it picked up new entries."""
+        if self._plot_index_dirty:
+            _save_linearity_cache(self._plot_index)
+            self._plot_index_dirty = False
+
     def toggle_path_entry(self):
         """Toggles the state of the path entry field and updates the folder list."""
         if self.override_path_var.get():
@@ -275,7 +488,8 @@ class JSONPlotterUI:
         new_path = self.path_entry.get().strip()
         if os.path.isdir(new_path):
             self.root_dir = new_path
-            self.folders = sorted([d for d in os.listdir(self.root_dir) if os.path.isdir(os.path.join(self.root_dir, d))])
+            self._virtual_cache = {}
+            self.folders = sorted(e.name for e in os.scandir(self.root_dir) if e.is_dir())
             self.update_folder_menu()
             self.select_root_button.config(text=f"Using: {self.root_dir}", state="normal")
         else:
@@ -286,9 +500,10 @@ class JSONPlotterUI:
         """Automatically finds the JSONs folder and populates the UI."""
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.root_dir = os.path.join(script_dir, "JSONs")
+        self._virtual_cache = {}
 
         if os.path.isdir(self.root_dir):
-            self.folders = sorted([d for d in os.listdir(self.root_dir) if os.path.isdir(os.path.join(self.root_dir, d))])
+            self.folders = sorted(e.name for e in os.scandir(self.root_dir) if e.is_dir())
             self.update_folder_menu()
             self.select_root_button.config(text=f"Found: {self.root_dir}", state="normal")
         else:
@@ -310,46 +525,105 @@ class JSONPlotterUI:
     def update_json_files(self, *args):
         """
         Updates the JSON file dropdown based on the selected dinosaur folder,
-        including dynamically generated "virtual" attack files.
+        including dynamically generated "virtual" attack files. File parsing
+        and validation run on a worker pool so the UI stays responsive; the
+        menu rebuild is scheduled back onto the Tk thread when they finish.
         """
         selected_dino_folder = self.folder_var.get()
         self.json_files_paths = {}
         self.virtual_files_data = {}
-        
+        self._update_token += 1
+        token = self._update_token
+
         if not selected_dino_folder or selected_dino_folder == "No Dinosaurs found":
-            self.json_files_paths = {}
-        else:
-            attributes_path = os.path.join(self.root_dir, selected_dino_folder, "Attributes")
-            if os.path.isdir(attributes_path):
-                # Get the BalanceAttributes file from the root folder
-                balance_file_path = os.path.join(self.root_dir, selected_dino_folder, f"DT_{selected_dino_folder}BalanceAttributes.json")
-                if os.path.exists(balance_file_path):
-                    self.json_files_paths[format_file_name(balance_file_path, selected_dino_folder)] = balance_file_path
-
-                # Get the plottable files from the Attributes folder
-                for file_path in glob.glob(os.path.join(attributes_path, "ATT_*.json")):
+            self._rebuild_json_menu()
+            return
+
+        attributes_path = os.path.join(self.root_dir, selected_dino_folder, "Attributes")
+        if not os.path.isdir(attributes_path):
+            print(f"Error: 'Attributes' folder not found inside {selected_dino_folder}.")
+            self._rebuild_json_menu()
+            return
+
+        # Get the BalanceAttributes file from the root folder
+        balance_file_path = os.path.join(self.root_dir, selected_dino_folder, f"DT_{selected_dino_folder}BalanceAttributes.json")
+        if os.path.exists(balance_file_path):
+            self.json_files_paths[format_file_name(balance_file_path, selected_dino_folder)] = (balance_file_path, None)
+
+        # A single scandir pass enumerates the attribute files and gives us
+        # cached stat results, instead of a glob followed by per-file stats.
+        entries = [e for e in os.scandir(attributes_path)
+                   if e.name.startswith("ATT_") and e.name.endswith(".json")]
+
+        def validate():
+            cache = self._plot_index
+            valid_paths = {}
+            try:
+                # Only files whose (mtime, size) changed since the cached check
+                # need to be parsed again; everything else is answered from disk.
+                pending = []
+                for entry in entries:
                     try:
-                        file_data = get_json_data(file_path)
-                        if file_data and ("FloatCurves" in file_data[0] or ("Properties" in file_data[0] and "FloatCurve" in file_data[0]["Properties"])):
-                            if not is_linear_or_flat(file_path):
-                                self.json_files_paths[format_file_name(file_path, selected_dino_folder)] = file_path
-                    except (KeyError, IndexError):
-                        continue # Skip malformed or irrelevant files
-
-                self.generate_virtual_attack_files(selected_dino_folder)
-            else:
-                self.json_files_paths = {}
-                print(f"Error: 'Attributes' folder not found inside {selected_dino_folder}.")
+                        stat = entry.stat()
+                    except OSError:
+                        continue # The file vanished between scandir and stat
+                    stamp = [stat.st_mtime, stat.st_size]
+                    cached = cache.get(entry.path)
+                    if cached is not None and cached[:2] == stamp:
+                        if cached[2]:
+                            valid_paths[format_file_name(entry.path, selected_dino_folder)] = (entry.path, None)
+                    else:
+                        pending.append((entry.path, stamp))
+
+                # Parse the remaining files in parallel; the linearity checks then
+                # run on the extracted curve arrays. Malformed or irrelevant files
+                # come back as None and are simply marked unplottable.
+                parsed = list(self._validator_pool.map(get_curve_file, [p for p, _ in pending]))
+                for (file_path, stamp), curve_file in zip(pending, parsed):
+                    plottable = curve_file is not None and not _is_linear_or_flat_curve(curve_file)
+                    cache[file_path] = stamp + [plottable]
+                    self._plot_index_dirty = True
+                    if plottable:
+                        valid_paths[format_file_name(file_path, selected_dino_folder)] = (file_path, curve_file)
+            finally:
+                # Always hand control back, even on an unexpected error, so
+                # the dropdown never sticks on the loading placeholder.
+                self.master.after(0, lambda: self._finish_update_json_files(token, selected_dino_folder, valid_paths))
+
+        # Show a placeholder while validation runs so the previous dinosaur's
+        # entries cannot be selected against the already-cleared file lists.
+        self._set_json_menu_placeholder("Loading...")
+        threading.Thread(target=validate, daemon=True).start()
+
+    def _finish_update_json_files(self, token, dinosaur_name, valid_paths):
+        """Applies background validation results; always runs on the Tk thread."""
+        if token != self._update_token:
+            return # The user already switched to another dinosaur.
+        self.json_files_paths.update(valid_paths)
+        if dinosaur_name in self._virtual_cache:
+            self.virtual_files_data = self._virtual_cache[dinosaur_name]
+        else:
+            self.generate_virtual_attack_files(dinosaur_name)
+            self._virtual_cache[dinosaur_name] = self.virtual_files_data
+        self._rebuild_json_menu()
 
+    def _set_json_menu_placeholder(self, text):
+        """Replaces the attribute dropdown contents with a single inert entry."""
         menu = self.json_menu["menu"]
         menu.delete(0, "end")
+        menu.add_command(label=text, command=lambda: 0)
+        self.json_file_var.set(text)
+        self.plot_button.config(state="disabled")
+
+    def _rebuild_json_menu(self):
+        """Repopulates the attribute dropdown from the current file lists."""
         all_display_names = sorted(list(self.json_files_paths.keys()) + list(self.virtual_files_data.keys()))
 
         if not all_display_names:
-            menu.add_command(label="No files found", command=lambda: 0)
-            self.json_file_var.set("No files found")
-            self.plot_button.config(state="disabled")
+            self._set_json_menu_placeholder("No files found")
         else:
+            menu = self.json_menu["menu"]
+            menu.delete(0, "end")
             for name in all_display_names:
                 menu.add_command(label=name, command=lambda value=name: self.json_file_var.set(value))
             self.json_file_var.set(all_display_names[0])
@@ -361,45 +635,31 @@ class JSONPlotterUI:
         balance_file_path = os.path.join(self.root_dir, dinosaur_name, f"DT_{dinosaur_name}BalanceAttributes.json")
         attack_power_file_path = os.path.join(self.root_dir, dinosaur_name, "Attributes", f"ATT_{dinosaur_name}_AttackPower.json")
 
-        balance_data = get_json_data(balance_file_path)
-        attack_power_data = get_json_data(attack_power_file_path)
+        damage_attributes = _get_damage_attributes(balance_file_path)
+        attack_power = get_curve_file(attack_power_file_path)
 
-        if not balance_data or not attack_power_data:
+        if damage_attributes is None or attack_power is None:
             print(f"Warning: Could not find required files for {dinosaur_name} to generate virtual attacks.")
             return
-            
-        try:
-            ap_curves = []
-            ap_content = attack_power_data[0]
-            if "FloatCurves" in ap_content:
-                ap_curves = ap_content["FloatCurves"]
-            elif "Properties" in ap_content and "FloatCurve" in ap_content["Properties"]:
-                ap_curves = [ap_content["Properties"]["FloatCurve"]]
-            else:
-                raise ValueError("AttackPower file has an unexpected format.")
-        except (KeyError, ValueError, IndexError) as e:
-            print(f"Error parsing AttackPower data: {e}")
-            return
 
-        damage_attributes = {k: v["AttributePercentageValues"] for k, v in balance_data[0]["Rows"].items() if k.startswith("Damage.") and v["AttributePercentageValues"] != 0}
-        
+        # Each life stage's keyframes are already packed arrays; every attack
+        # below just scales the shared base values instead of re-walking the
+        # keyframe dicts per attack.
+        # Only the first two curves are used, assuming Senior and Elder.
+        base_curves = []
+        for time_points, values in attack_power.curves[:2]:
+            mask = time_points > 0.0
+            base_curves.append((time_points[mask], values[mask]))
+
         for attack_name, damage_value in damage_attributes.items():
             clean_attack_name = attack_name.split('.')[-1]
             formatted_name = format_virtual_name(clean_attack_name)
             display_name = f"{formatted_name} Attack"
-            
+
             # Generate the new curves for each life stage
-            new_curves = []
-            # Plot only the first two curves, assuming Senior and Elder
-            for curve in ap_curves[:2]:
-                time_points = []
-                values = []
-                for key in curve["Keys"]:
-                    if key["Time"] > 0.0:
-                        time_points.append(key["Time"])
-                        values.append(key["Value"] * damage_value)
-                new_curves.append({"Time": time_points, "Values": values})
-            
+            new_curves = [{"Time": time_points, "Values": values * damage_value}
+                          for time_points, values in base_curves]
+
             # Store the data and its label
             self.virtual_files_data[display_name] = {
                 "curves": new_curves,
@@ -410,7 +670,7 @@ class JSONPlotterUI:
     def enable_plot_button(self, *args):
         """Enables the plot button only if a valid file is selected."""
         selected_file_name = self.json_file_var.get()
-        if selected_file_name and selected_file_name != "No files found":
+        if selected_file_name and selected_file_name not in ("No files found", "Loading..."):
             if "Balance Attributes" in selected_file_name:
                 self.plot_button.config(text="Show Data Table", state="normal", command=self.show_selected_data_table)
             else:
@@ -421,9 +681,9 @@ class JSONPlotterUI:
     def show_selected_data_table(self):
         selected_file_name = self.json_file_var.get()
         selected_dino_folder = self.folder_var.get()
-        full_path = self.json_files_paths.get(selected_file_name)
-        if full_path:
-            show_balance_table(full_path)
+        entry = self.json_files_paths.get(selected_file_name)
+        if entry:
+            show_balance_table(entry[0])
 
     def plot_selected_file(self):
         """Calls the plotting function with the selected file path."""
@@ -442,39 +702,36 @@ class JSONPlotterUI:
         else:
             # Handle regular files from disk
             selected_dino_folder = self.folder_var.get()
-            full_path = self.json_files_paths.get(selected_file_name)
-            if full_path:
-                file_data = get_json_data(full_path)
-                
-                if file_data:
-                    float_curves = file_data[0].get("FloatCurves") or [file_data[0].get("Properties", {}).get("FloatCurve")]
-                    if float_curves and float_curves[0]:
-                        time_points_list = []
-                        values_list = []
-                        for i, curve in enumerate(float_curves[:2]):
-                            time_points = [key["Time"] for key in curve["Keys"]]
-                            values = [key["Value"] for key in curve["Keys"]]
-                            
-                            # Check for the specific weight and scale curve conditions
-                            if selected_file_name.lower() in ["weight", "scale"]:
-                                if time_points and time_points[-1] < 1.0:
-                                    last_value = values[-1]
-                                    time_points.append(1.0)
-                                    values.append(last_value)
-
-                            y_label = "Value"
-                            conversion_factor = 1.0
-                            if "speed" in selected_file_name.lower():
-                                y_label = "Value (km/h)"
-                                conversion_factor = 0.036
-                            elif "weight" in selected_file_name.lower():
-                                y_label = "Value (kg)"
-                            
-                            values = [v * conversion_factor for v in values]
-                            time_points_list.append(time_points)
-                            values_list.append(values)
-                        
-                        plot_data(time_points_list, values_list, selected_file_name, y_label)
+            entry = self.json_files_paths.get(selected_file_name)
+            if entry:
+                full_path, curve_file = entry
+                if curve_file is None:
+                    # Validated from the persistent index; extract on demand.
+                    curve_file = get_curve_file(full_path)
+
+                if curve_file:
+                    time_points_list = []
+                    values_list = []
+                    for time_points, values in curve_file.curves[:2]:
+                        # Check for the specific weight and scale curve conditions
+                        if selected_file_name.lower() in ["weight", "scale"]:
+                            if time_points.size and time_points[-1] < 1.0:
+                                time_points = np.append(time_points, 1.0)
+                                values = np.append(values, values[-1])
+
+                        y_label = "Value"
+                        conversion_factor = 1.0
+                        if "speed" in selected_file_name.lower():
+                            y_label = "Value (km/h)"
+                            conversion_factor = 0.036
+                        elif "weight" in selected_file_name.lower():
+                            y_label = "Value (kg)"
+
+                        values = values * conversion_factor
+                        time_points_list.append(time_points)
+                        values_list.append(values)
+
+                    plot_data(time_points_list, values_list, selected_file_name, y_label)
 
 # Run the UI
 if __name__ == "__main__":